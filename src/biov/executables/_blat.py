@@ -1,16 +1,21 @@
 """Fast sequence search command line tool."""
 
+import os
 import platform
+import posixpath
 import re
 import shutil
 import subprocess  # noqa: S404
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, TemporaryDirectory
 from typing import Annotated, Any
 
 import fsspec
 import pandas as pd
+from fsspec.core import split_protocol
+from fsspec.utils import infer_compression
 from Bio.Data.IUPACData import (
     protein_letters,
     unambiguous_dna_letters,
@@ -28,6 +33,11 @@ _SUB_RANGE_PATTERN = re.compile(
     r"(?P<path>.+\.2bit|\.nib)(?::(?P<seqid>[a-zA-Z]\w+))?:(?P<start>\d+)-(?P<end>\d+)$"
 )
 
+_SEQ_PATTERN = re.compile(
+    rf"^([{unambiguous_dna_letters}]+|[{unambiguous_rna_letters}]+|[{protein_letters}]+)$",
+    flags=re.IGNORECASE,
+)
+
 _PSL_HEAD = """psLayout version 3
 
 match	mis- 	rep. 	N's	Q gap	Q gap	T gap	T gap	strand	Q        	Q   	Q    	Q  	T        	T   	T    	T  	block	blockSizes 	qStarts	 tStarts
@@ -63,6 +73,35 @@ _BLAT_COLUMNS = [  # Same as output from https://genome.ucsc.edu/cgi-bin/hgBlat
     "qStarts",
     "tStarts",
 ]
+_BLAT_DEFAULTS: dict[str, Any] = {  # Options of `blat_cli` and their defaults
+    "t": "dna",
+    "q": "dna",
+    "prot": False,
+    "ooc": None,
+    "tileSize": None,
+    "stepSize": None,
+    "oneOff": "0",
+    "minMatch": None,
+    "minScore": 30,
+    "minIdentity": None,
+    "maxGap": 2,
+    "makeOoc": None,
+    "repMatch": None,
+    "noSimpRepMask": False,
+    "mask": None,
+    "qMask": None,
+    "repeats": None,
+    "minRepDivergence": 15,
+    "dots": None,
+    "trimT": False,
+    "noTrimA": False,
+    "trimHardA": False,
+    "fastMap": False,
+    "out": "psl",
+    "fine": False,
+    "maxIntron": 750000,
+    "extendThroughN": False,
+}
 
 blat_app = Typer()
 
@@ -81,10 +120,23 @@ def _handle_fsspec_path(path: str, stack: ExitStack) -> str:
         *protocols, path = path.split("::")
         if len(protocols) == 0 or protocols[-1] != "filecache":
             protocols = [*protocols, "filecache"]
-        db = stack.enter_context(NamedTemporaryFile())
-        with fsspec.open("::".join([*protocols, path]), compression="infer") as x:
-            shutil.copyfileobj(x, db)  # pyright: ignore
-        path = db.name
+        # BLAT infers file type from extension, so keep the original file name
+        outermost = next(s for s in [*protocols, path] if "://" in s)
+        name = posixpath.basename(split_protocol(outermost)[1])
+        if (compression := infer_compression(name)) is not None:
+            name = os.path.splitext(name)[0]
+        tmpdir = stack.enter_context(TemporaryDirectory())
+        urlpath = "::".join([*protocols, path])
+        path = os.path.join(tmpdir, name)
+        if len(protocols) == 1 and compression is None:
+            # link the cached file instead of copying it
+            os.symlink(fsspec.open_local(urlpath), path)
+        else:
+            with (
+                fsspec.open(urlpath, compression=compression) as x,
+                open(path, "wb") as db,
+            ):
+                shutil.copyfileobj(x, db, length=4 * 1024 * 1024)  # pyright: ignore
     return path
 
 
@@ -104,11 +156,7 @@ def _handle_seq(path: str, stack: ExitStack) -> str:
             len(path) >= 256  # Maximum file name length
             or not Path(path).exists()
         )
-        and re.match(
-            rf"^([{unambiguous_dna_letters}]+|[{unambiguous_rna_letters}]+|[{protein_letters}]+)$",
-            path,
-            flags=re.IGNORECASE,
-        )
+        and _SEQ_PATTERN.match(path)
     ):
         f = stack.enter_context(NamedTemporaryFile("w+t", suffix=".fa"))
         name = path if len(path) <= 23 else f"{path[:11]}_{len(path)}"
@@ -327,72 +375,28 @@ def blat_cli(
 ):
     """Standalone BLAT v. 39x1 fast sequence search command line tool."""
     *query, output = query
-    kwargs: dict[str, Any] = {}
-    if prot:
-        kwargs["prot"] = prot
-    elif t != "dna":
-        kwargs["t"] = t
-    elif q != "dna":
-        kwargs["q"] = q
-    if ooc is not None:
-        kwargs["ooc"] = ooc
-    if tileSize is not None:
-        kwargs["tileSize"] = tileSize
-    if stepSize is not None:
-        kwargs["stepSize"] = stepSize
-    if oneOff != "0":
-        kwargs["oneOff"] = oneOff
-    if minMatch is not None:
-        kwargs["minMatch"] = minMatch
-    if minScore != 30:
-        kwargs["minScore"] = minScore
-    if minIdentity is not None:
-        kwargs["minIdentity"] = minIdentity
-    if maxGap != 2:
-        kwargs["maxGap"] = maxGap
-    if makeOoc is not None:
-        kwargs["makeOoc"] = makeOoc
-    if repMatch is not None:
-        kwargs["repMatch"] = repMatch
-    if noSimpRepMask:
-        kwargs["noSimpRepMask"] = noSimpRepMask
-    if mask is not None:
-        kwargs["mask"] = mask
-    if qMask is not None:
-        kwargs["qMask"] = qMask
-    if repeats is not None:
-        kwargs["repeats"] = repeats
-    if minRepDivergence != 15:
-        kwargs["minRepDivergence"] = minRepDivergence
-    if dots is not None:
-        kwargs["dots"] = dots
-    if trimT:
-        kwargs["trimT"] = trimT
-    if noTrimA:
-        kwargs["noTrimA"] = noTrimA
-    if trimHardA:
-        kwargs["trimHardA"] = trimHardA
-    if fastMap:
-        kwargs["fastMap"] = fastMap
-    if out != "psl":
-        kwargs["out"] = out
-    if fine:
-        kwargs["fine"] = fine
-    if maxIntron != 750000:
-        kwargs["maxIntron"] = maxIntron
-    if extendThroughN:
-        kwargs["extendThroughN"] = extendThroughN
+    options = locals()
+    kwargs: dict[str, Any] = {
+        k: options[k]
+        for k, default in _BLAT_DEFAULTS.items()
+        if options[k] is not None and options[k] != default
+    }
+    if prot:  # synonymous with -t=prot -q=prot
+        kwargs.pop("t", None)
+        kwargs.pop("q", None)
     o = blat(database, query, **kwargs)
-    body = o.to_csv(sep="\t", header=False)
-    content = body if noHead else f"{_PSL_HEAD}{body}"
     with fsspec.open(output, "wt") as f:
-        f.write(content)  # pyright: ignore
+        if not noHead:
+            f.write(_PSL_HEAD)  # pyright: ignore
+        o.to_csv(f, sep="\t", header=False, index=False, chunksize=65536)  # pyright: ignore
 
 
 @typechecked
 def blat(
     database: str,
     query: str | list[str],
+    *,
+    threads: int | None = None,
     **kwargs: Any,
 ) -> pd.DataFrame:
     """Standalone BLAT v. 39x1 fast sequence search command line tool.
@@ -400,6 +404,7 @@ def blat(
     Args:
         database: a .fa, .nib or .2bit file, or a list of these files with one file name per line.
         query: Same as database but additionally support directly providing sequence.
+        threads: maximum number of concurrent blat processes that queries are split across, defaults to the number of CPUs. Each process loads the database on its own, set to 1 to run a single process.
         **kwargs: extra options will pass directly to original blat executable.
 
     Returns:
@@ -436,7 +441,7 @@ def blat(
             )
         except subprocess.CalledProcessError as e:
             raise RuntimeError("Sorry, biov could not rsync blat from ucsc.") from e
-        return blat(database, query, **kwargs)
+        return blat(database, query, threads=threads, **kwargs)
 
     if blat_exec is None:
         raise FileNotFoundError("Sorry, biov could not find blat.")
@@ -448,29 +453,28 @@ def blat(
             _q = _handle_fsspec_path(_q, stack)
             _q = _handle_seq(_q, stack)
             queries.append(_q)
-        if len(queries) > 1:
-            names_file = stack.enter_context(NamedTemporaryFile("w+t"))
-            names_file.writelines([f"{_q}\n" for _q in queries])
-            query = [names_file.name]
-        else:
-            query = queries
-        f = stack.enter_context(NamedTemporaryFile(mode="w+t"))
-        subprocess.run(
-            [
-                blat_exec,
-                "-noHead",
-                *[
-                    f"-{k}" if isinstance(v, bool) and v else f"-{k}={v}"
-                    for k, v in kwargs.items()
-                    if v is not None
-                    if k != "noHead"
-                ],
-                database,
-                *query,
-                f.name,
-            ]
-        )
-        return pd.read_table(
-            f,
-            names=_BLAT_COLUMNS,
+        options = [
+            f"-{k}" if isinstance(v, bool) and v else f"-{k}={v}"
+            for k, v in kwargs.items()
+            if v is not None
+            if k != "noHead"
+        ]
+        # BLAT is single-threaded, so scatter queries over several processes
+        n = min(len(queries), threads or os.cpu_count() or 1)
+        commands, outputs = [], []
+        for i in range(n):
+            shard = queries[i * len(queries) // n : (i + 1) * len(queries) // n]
+            if len(shard) > 1:
+                names_file = stack.enter_context(NamedTemporaryFile("w+t"))
+                names_file.writelines([f"{_q}\n" for _q in shard])
+                names_file.flush()
+                shard = [names_file.name]
+            f = stack.enter_context(NamedTemporaryFile(mode="w+t"))
+            commands.append([blat_exec, "-noHead", *options, database, *shard, f.name])
+            outputs.append(f)
+        with ThreadPoolExecutor(max_workers=n) as executor:
+            list(executor.map(subprocess.run, commands))
+        results = [pd.read_table(f, names=_BLAT_COLUMNS) for f in outputs]
+        return pd.concat(
+            [r for r in results if not r.empty] or results[:1], ignore_index=True
         )
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 from urllib.parse import unquote
 
+import fsspec
 import pandas as pd
 from pandas._typing import FilePath, ReadCsvBuffer, WriteBuffer
 
@@ -51,6 +52,59 @@ GFF_COLUMNS = [
 ]
 
 
+def _skip_comment(row) -> str:
+    """Skip comment lines in pyarrow CSV reader.
+
+    Returns:
+        "skip" if the row is a comment or directive else "error".
+    """
+    return "skip" if row.text.startswith("#") else "error"
+
+
+def _read_table_arrow(
+    filepath: FilePath, names: list[str], compression: str | None = "infer"
+) -> pd.DataFrame:
+    """Read GFF3 records with the multi-threaded pyarrow CSV reader.
+
+    Args:
+        filepath: local path or fsspec URL
+        names: names of the 9 primary columns
+        compression: compression of the file, inferred from extension by default
+
+    Returns:
+        A DataFrame whose low-cardinality columns are categorical.
+    """
+    import pyarrow as pa
+    from pyarrow import csv
+
+    category = pa.dictionary(pa.int32(), pa.string())
+    types = [
+        category,  # seqid
+        category,  # source
+        category,  # type
+        pa.int64(),  # start
+        pa.int64(),  # end
+        pa.float64(),  # score
+        category,  # strand
+        category,  # phase
+        pa.string(),  # attributes
+    ]
+    with fsspec.open(filepath, "rb", compression=compression) as f:
+        table = csv.read_csv(
+            f,
+            read_options=csv.ReadOptions(column_names=names, block_size=64 << 20),
+            parse_options=csv.ParseOptions(
+                delimiter="\t", quote_char=False, invalid_row_handler=_skip_comment
+            ),
+            convert_options=csv.ConvertOptions(
+                column_types=dict(zip(names, types)),
+                null_values=["."],
+                strings_can_be_null=True,
+            ),
+        )
+    return table.to_pandas()
+
+
 def read_gff3(
     filepath_or_buffer: FilePath | ReadCsvBuffer[bytes] | ReadCsvBuffer[str],
     explode_attributes: bool = True,
@@ -61,7 +115,7 @@ def read_gff3(
     Args:
         filepath_or_buffer: support fsspec chain (available in pandas 3.0)
         explode_attributes: explode attributes into columns, notice that attributes with same name as primary columns (such as `score`) will be ignored.
-        **kwargs: will pass to `pd.read_table`
+        **kwargs: will pass to `pd.read_table`. Without extra kwargs, paths are parsed by the multi-threaded pyarrow CSV reader instead, and `seqid`, `source`, `type`, `strand` and `phase` become categorical.
 
     Returns:
         A BioDataFrame with at least 9 columns
@@ -89,19 +143,43 @@ def read_gff3(
     filepath_or_buffer, kwargs = preprocessing(filepath_or_buffer, **kwargs)
 
     def explode(attributes: pd.Series):
-        attr_df = pd.json_normalize(
-            attributes.apply(
-                lambda attrs: dict(
-                    [unquote(i) for i in kv.split("=", maxsplit=1)]
-                    for kv in attrs.split(";")
-                )
-                if isinstance(attrs, str)
-                else {}
-            )  # type: ignore
+        index = attributes.index
+        attributes = attributes.dropna()
+        if attributes.empty:
+            return pd.DataFrame(index=index)
+        # one row per `key=value` pair, labelled with its originating row
+        pairs = attributes.str.split(";").explode()
+        pairs = pairs[pairs != ""]
+        split = pairs.str.split("=", n=1, expand=True).reindex(columns=[0, 1])
+        kv = pd.DataFrame(
+            {"row": pairs.index, "key": split[0].array, "value": split[1].array}
+        )
+        for c in ("key", "value"):
+            # only decode values that actually contain escapes
+            mask = kv[c].str.contains("%", na=False)
+            if mask.any():
+                kv.loc[mask, c] = kv.loc[mask, c].map(unquote)
+        # later duplicates win, mirroring dict construction
+        kv = kv.drop_duplicates(["row", "key"], keep="last")
+        attr_df = (
+            kv.pivot(index="row", columns="key", values="value")
+            .reindex(index=index, columns=kv["key"].unique())
+            .rename_axis(index=None, columns=None)
         )
         return attr_df[[c for c in attr_df.columns if c not in names]]
 
-    raw_df: pd.DataFrame = pd.read_table(filepath_or_buffer, dtype={}, **kwargs)
+    raw_df: pd.DataFrame
+    if isinstance(filepath_or_buffer, str | os.PathLike) and kwargs.keys() <= {
+        "comment",
+        "na_values",
+        "names",
+        "compression",
+    }:
+        raw_df = _read_table_arrow(
+            filepath_or_buffer, names, kwargs.get("compression", "infer")
+        )
+    else:
+        raw_df = pd.read_table(filepath_or_buffer, dtype={}, **kwargs)
     raw_df["start"] -= 1
     if explode_attributes:
         raw_df = pd.concat(
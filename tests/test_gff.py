@@ -46,3 +46,28 @@ chr1\t.\tgene\t100\t200\t.\t+\t.\tID=gene1;Name=TestGene;Dbxref=NCBI:123;hello=w
 chr1\t.\texon\t150\t180\t.\t+\t.\tID=exon1;Parent=gene1;hello=world
 """
     )
+
+
+def test_read_gff3_attributes():
+    df = read_gff3(
+        StringIO(
+            "chr1\t.\tgene\t100\t200\t.\t+\t.\tID=gene1;Note=a%3Bb%2C%C3%A9;\n"
+            "chr1\t.\tgene\t300\t400\t.\t+\t.\t.\n"
+            "chr1\t.\tgene\t500\t600\t.\t+\t.\tID=gene2;ID=gene3\n"
+        )
+    )
+    assert list(df.columns) == [*GFF_COLUMNS[:-1], "ID", "Note"]
+    assert df.loc[0, "Note"] == "a;b,é"
+    assert df["ID"].isna()[1]
+    assert df.loc[2, "ID"] == "gene3"
+
+
+def test_read_gff3_path():
+    with NamedTemporaryFile(mode="w", suffix=".gff3") as f:
+        f.write(SAMPLE_GFF)
+        f.flush()
+        df = read_gff3(f.name)
+    assert df["type"].dtype == "category"
+    assert df["start"].tolist() == [99, 149]
+    assert df.loc[1, "Parent"] == "gene1"
+    assert df.to_gff3() == SAMPLE_GFF